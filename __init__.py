@@ -4,8 +4,11 @@ from .nodes.weighted_dict import (
     WeightedDict, 
     WeightedDictToPrompt,
     WeightedDictSelectGroup,
-    WeightedDictConcat
+    WeightedDictConcat,
+    WeightedDictUpdateWeights,
+    WeightedDictSample
 )
+from .nodes.prompt_dedupe import PromptDedupe
 
 NODE_CLASS_MAPPINGS = {
     "WeightedDictInput": WeightedDictInput,
@@ -13,7 +16,10 @@ NODE_CLASS_MAPPINGS = {
     "WeightedDict": WeightedDict,
     "WeightedDictToPrompt": WeightedDictToPrompt,
     "WeightedDictSelectGroup": WeightedDictSelectGroup,
-    "WeightedDictConcat": WeightedDictConcat
+    "WeightedDictConcat": WeightedDictConcat,
+    "WeightedDictUpdateWeights": WeightedDictUpdateWeights,
+    "WeightedDictSample": WeightedDictSample,
+    "PromptDedupe": PromptDedupe
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
@@ -22,7 +28,10 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "WeightedDict": "Weighted Dict",
     "WeightedDictToPrompt": "Weighted Dict To Prompt",
     "WeightedDictSelectGroup": "Weighted Dict Select Group",
-    "WeightedDictConcat": "Weighted Dict Concat"
+    "WeightedDictConcat": "Weighted Dict Concat",
+    "WeightedDictUpdateWeights": "Weighted Dict Update Weights",
+    "WeightedDictSample": "Weighted Dict Sample",
+    "PromptDedupe": "Prompt Dedupe"
 }
 
 __all__ = ['NODE_CLASS_MAPPINGS', 'NODE_DISPLAY_NAME_MAPPINGS']
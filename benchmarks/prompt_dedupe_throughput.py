@@ -0,0 +1,62 @@
+"""Throughput benchmark for PromptDedupe.
+
+Times near-duplicate filtering over two workloads where every other prompt is
+a light edit of an earlier one:
+
+- random: prompts drawn from a large vocabulary, which rarely share LSH buckets
+- template: prompts rendered from one shared template with a few random slots,
+  as WeightedDictToPrompt produces, so unrelated prompts share many buckets
+
+Run from the project root:
+
+    python benchmarks/prompt_dedupe_throughput.py [num_prompts]
+"""
+import os
+import random
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from nodes.prompt_dedupe import PromptDedupe
+
+TEMPLATE = (
+    "a cinematic photo of a {} standing in a {} during {} "
+    "with soft light and film grain, highly detailed"
+)
+
+
+def build_random_prompts(num_prompts, words_per_prompt=20, vocabulary_size=2000, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(vocabulary_size)]
+    unique = [" ".join(rng.choices(vocabulary, k=words_per_prompt)) for _ in range(num_prompts // 2)]
+    edited = [prompt.rsplit(" ", 1)[0] + " detailed" for prompt in unique]
+    return unique + edited
+
+
+def build_template_prompts(num_prompts, vocabulary_size=5000, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(vocabulary_size)]
+    unique = [TEMPLATE.format(*rng.choices(vocabulary, k=3)) for _ in range(num_prompts // 2)]
+    edited = [prompt + ", 8k" for prompt in unique]
+    return unique + edited
+
+
+def run(label, prompts):
+    start = time.perf_counter()
+    kept, removed = PromptDedupe().dedupe_prompts(prompts)
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<9} prompts: {len(prompts):,}  kept: {len(kept):,}  removed: {removed:,}  "
+          f"elapsed: {elapsed:.2f} s  ({len(prompts) / elapsed:,.0f} prompts/s)")
+
+
+def main():
+    num_prompts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run("random", build_random_prompts(num_prompts))
+    run("template", build_template_prompts(num_prompts))
+
+
+if __name__ == "__main__":
+    main()
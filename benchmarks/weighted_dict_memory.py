@@ -0,0 +1,63 @@
+"""Memory benchmark for weighted dictionaries with heavily repeated values.
+
+Builds a large weighted dictionary whose values are drawn from a small
+vocabulary, the way values arrive from widgets or loaded files (each one a
+separate ``str`` object), and compares the memory held by the raw dictionary
+with the one produced by ``WeightedDictConcat``, which routes values through
+a per-call deduplication pool.
+
+The reported saving assumes the raw input is freed once the pooled copy
+exists. Inside ComfyUI the upstream output usually stays cached, in which case
+the pooled copy is additional memory on top of it; the saving then applies
+only to what downstream nodes hold.
+
+Run from the project root:
+
+    python benchmarks/weighted_dict_memory.py [num_entries] [num_distinct_values]
+"""
+import os
+import sys
+import tracemalloc
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from nodes.weighted_dict import WeightedDictConcat
+
+
+def build_raw_dict(num_entries, num_distinct):
+    # "".join() yields a fresh string object per entry, like deserialized input
+    vocabulary = [f"a detailed description of style number {i}" for i in range(num_distinct)]
+    items = {f"key{i}": "".join(["", vocabulary[i % num_distinct]]) for i in range(num_entries)}
+    weights = {key: 1.0 for key in items}
+    return {"items": items, "weights": weights}
+
+
+def main():
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    num_distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+    # Both figures are measured from the same starting point and include the
+    # keys, weights and containers each dictionary keeps alive
+    tracemalloc.start()
+    raw = build_raw_dict(num_entries, num_distinct)
+    raw_bytes, _ = tracemalloc.get_traced_memory()
+    raw_values = len({id(v) for v in raw["items"].values()})
+
+    pooled = WeightedDictConcat().concat_dicts(raw)[0]
+    del raw
+    pooled_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    pooled_values = len({id(v) for v in pooled["items"].values()})
+
+    print(f"entries:               {num_entries:,}")
+    print(f"distinct values:       {num_distinct:,}")
+    print(f"raw value objects:     {raw_values:,}")
+    print(f"pooled value objects:  {pooled_values:,}")
+    print(f"raw dict memory:       {raw_bytes / 2**20:,.1f} MiB")
+    print(f"pooled dict memory:    {pooled_bytes / 2**20:,.1f} MiB")
+    print(f"reduction:             {1 - pooled_bytes / raw_bytes:.1%}")
+
+
+if __name__ == "__main__":
+    main()
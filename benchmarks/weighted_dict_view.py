@@ -0,0 +1,57 @@
+"""Allocation benchmark for WeightedDict.reformat_dict.
+
+Compares building the ``{key: {"value": v, "weight": w}}`` layout eagerly,
+with one inner dict per entry, against the lazy WeightedDictView returned by
+``WeightedDict.reformat_dict``, then renders a prompt through each.
+
+Run from the project root:
+
+    python benchmarks/weighted_dict_view.py [num_entries]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from nodes.weighted_dict import WeightedDict, WeightedDictToPrompt
+
+
+def reformat_eagerly(weighted_dict):
+    items = weighted_dict["items"]
+    weights = weighted_dict["weights"]
+    return {key: {"value": items[key], "weight": weights[key]} for key in items}
+
+
+def measure(label, reformat, weighted_dict):
+    tracemalloc.start()
+    start = time.perf_counter()
+    reformatted = reformat(weighted_dict)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    WeightedDictToPrompt().render_prompt("{{ key0 }} and {{ key1 }}", reformatted)
+    render_elapsed = time.perf_counter() - start
+
+    print(f"{label:<8} reformat: {elapsed * 1000:8.1f} ms  {current / 2**20:8.1f} MiB retained  "
+          f"render: {render_elapsed * 1000:8.1f} ms")
+
+
+def main():
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    weighted_dict = {
+        "items": {f"key{i}": f"value{i % 1000}" for i in range(num_entries)},
+        "weights": {f"key{i}": 1.0 for i in range(num_entries)},
+    }
+
+    print(f"entries: {num_entries:,}")
+    measure("eager", reformat_eagerly, weighted_dict)
+    measure("view", lambda d: WeightedDict().reformat_dict(d)[0], weighted_dict)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import zlib
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+# 64-bit multiply-shift hashing: h(x) = (a * x + b) mod 2**64 >> 32, with a odd
+_HASH_SHIFT = np.uint64(32)
+_CHUNK_SIZE = 512
+# Kept prompts recorded per LSH bucket. Buckets filled by shared template text
+# would otherwise grow with the batch and make every lookup scan all of them.
+_MAX_BUCKET_SIZE = 32
+
+
+def _shingles(text: str, shingle_size: int) -> List[str]:
+    """Split a prompt into overlapping word shingles.
+
+    Args:
+        text: Prompt text
+        shingle_size: Number of consecutive tokens per shingle
+
+    Returns:
+        list: Shingles; prompts shorter than shingle_size yield a single shingle
+    """
+    tokens = text.lower().split()
+    if len(tokens) <= shingle_size:
+        return [" ".join(tokens)]
+    return [" ".join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)]
+
+
+def _candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    return 1.0 - (1.0 - similarity ** rows) ** bands
+
+
+def _integrate(f, start: float, end: float, steps: int = 100) -> float:
+    width = (end - start) / steps
+    return sum(f(start + (i + 0.5) * width) for i in range(steps)) * width
+
+
+def _choose_bands(num_perm: int, threshold: float, false_negative_weight: float = 0.8) -> Tuple[int, int]:
+    """Pick (bands, rows) with bands * rows == num_perm for the given similarity threshold.
+
+    A pair with Jaccard similarity s becomes a candidate with probability
+    1 - (1 - s**rows)**bands. The split minimising the weighted area of missed
+    duplicates (above threshold) and spurious candidates (below it) is chosen.
+    Missed duplicates are weighted higher since every candidate is verified
+    against its full signature anyway.
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        false_positive = _integrate(lambda s: _candidate_probability(s, bands, rows), 0.0, threshold)
+        false_negative = _integrate(lambda s: 1.0 - _candidate_probability(s, bands, rows), threshold, 1.0)
+        error = (1.0 - false_negative_weight) * false_positive + false_negative_weight * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHashLSH:
+    """Streaming near-duplicate filter using MinHash signatures and LSH banding.
+
+    Signatures are computed a chunk at a time with NumPy. Only the signatures of
+    kept prompts and their band buckets are retained, so memory grows with the
+    number of unique prompts rather than with the number of pairs. Each bucket
+    records at most _MAX_BUCKET_SIZE kept prompts, which bounds the candidates
+    checked per prompt; candidates are verified together against a stacked
+    signature matrix.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        self._min_matches = threshold * num_perm
+
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(0, 2**63, size=(num_perm, 1), dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=(num_perm, 1), dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._signatures = np.empty((_CHUNK_SIZE, num_perm), dtype=np.uint32)
+        self._count = 0
+
+    def signatures(self, prompts: List[str]) -> np.ndarray:
+        """Compute MinHash signatures for a batch of prompts.
+
+        Args:
+            prompts: Prompt texts
+
+        Returns:
+            np.ndarray: uint32 array of shape (len(prompts), num_perm)
+        """
+        offsets = []
+        hashes = []
+        for prompt in prompts:
+            offsets.append(len(hashes))
+            hashes.extend(zlib.crc32(s.encode("utf-8")) for s in _shingles(prompt, self.shingle_size))
+
+        values = np.asarray(hashes, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            permuted = (self._a * values + self._b) >> _HASH_SHIFT
+        # Shifted hashes fit in 32 bits, halving the memory held per kept signature
+        return np.minimum.reduceat(permuted, offsets, axis=1).T.astype(np.uint32)
+
+    def _is_duplicate(self, signature: np.ndarray, band_keys: List[bytes]) -> bool:
+        candidates = []
+        for band, key in enumerate(band_keys):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                candidates.extend(bucket)
+        if not candidates:
+            return False
+
+        indices = np.unique(np.asarray(candidates, dtype=np.intp))
+        matches = np.count_nonzero(self._signatures[indices] == signature, axis=1)
+        return bool((matches >= self._min_matches).any())
+
+    def _insert(self, signature: np.ndarray, band_keys: List[bytes]) -> None:
+        index = self._count
+        if index == len(self._signatures):
+            grown = np.empty((2 * index, self.num_perm), dtype=np.uint32)
+            grown[:index] = self._signatures
+            self._signatures = grown
+        self._signatures[index] = signature
+        self._count += 1
+
+        for band, key in enumerate(band_keys):
+            bucket = self._buckets[band].setdefault(key, [])
+            if len(bucket) < _MAX_BUCKET_SIZE:
+                bucket.append(index)
+
+    def filter(self, prompts: Iterable[str]) -> Iterator[str]:
+        """Yield prompts in order, dropping any that nearly duplicate an earlier kept prompt.
+
+        Args:
+            prompts: Prompt texts, consumed lazily in chunks
+
+        Yields:
+            str: First occurrence of each group of near-duplicate prompts
+        """
+        chunk: List[str] = []
+        for prompt in prompts:
+            chunk.append(prompt)
+            if len(chunk) >= _CHUNK_SIZE:
+                yield from self._filter_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._filter_chunk(chunk)
+
+    def _filter_chunk(self, chunk: List[str]) -> Iterator[str]:
+        signatures = self.signatures(chunk)
+        # View each band of a signature as one opaque bytes value to use as a bucket key
+        band_view = np.ascontiguousarray(signatures).view(np.dtype((np.void, self.rows * signatures.itemsize)))
+        for prompt, signature, band_keys in zip(chunk, signatures, band_view.tolist()):
+            if self._is_duplicate(signature, band_keys):
+                continue
+            self._insert(signature, band_keys)
+            yield prompt
+
+
+class PromptDedupe:
+    @classmethod
+    def INPUT_TYPES(cls):
+        """Define the input parameters for the node.
+
+        Returns:
+            dict: Configuration for input parameters:
+                - prompts: Rendered prompts, one list element per prompt
+                - threshold: Jaccard similarity above which a prompt counts as a duplicate
+                - shingle_size: Number of consecutive words per shingle
+                - num_perm: Number of MinHash permutations (signature length)
+                - split_lines: Opt in to treating every line of an incoming string as its own prompt
+        """
+        return {
+            "required": {
+                "prompts": ("STRING", {"forceInput": True}),
+                "threshold": ("FLOAT", {"default": 0.8, "min": 0.0, "max": 1.0, "step": 0.01}),
+                "shingle_size": ("INT", {"default": 3, "min": 1, "max": 16}),
+                "num_perm": ("INT", {"default": 128, "min": 16, "max": 512, "step": 16}),
+                "split_lines": ("BOOLEAN", {"default": False}),
+            },
+        }
+
+    INPUT_IS_LIST = True
+    RETURN_TYPES = ("STRING", "INT")
+    RETURN_NAMES = ("prompts", "removed_count")
+    OUTPUT_IS_LIST = (True, False)
+    FUNCTION = "dedupe_prompts"
+    CATEGORY = "llm-utils"
+
+    def dedupe_prompts(self, prompts, threshold=(0.8,), shingle_size=(3,), num_perm=(128,), split_lines=(False,)) -> tuple[List[str], int]:
+        """Remove near-duplicate prompts, keeping the first occurrence of each.
+
+        Inputs arrive as lists (INPUT_IS_LIST); only the first element of each
+        setting is used.
+
+        Args:
+            prompts: Prompts from WeightedDictToPrompt or WeightedDictSelectGroup; a
+                multi-line string is one prompt unless split_lines is set
+            threshold: Estimated Jaccard similarity at or above which a prompt is dropped
+            shingle_size: Number of consecutive words per shingle
+            num_perm: Number of MinHash permutations
+            split_lines: Split each string into one prompt per line, ignoring blank lines;
+                for newline separated batches
+
+        Returns:
+            tuple[list[str], int]: Remaining prompts in input order and the number removed
+        """
+        if isinstance(prompts, str):
+            prompts = [prompts]
+        if split_lines[0]:
+            prompts = [line for text in prompts for line in text.splitlines() if line.strip()]
+
+        lsh = MinHashLSH(threshold=threshold[0], num_perm=num_perm[0], shingle_size=shingle_size[0])
+        kept = list(lsh.filter(prompts))
+        return kept, len(prompts) - len(kept)
@@ -1,6 +1,48 @@
 import random
+from collections.abc import Mapping
 from typing import Dict, Any
 
+from .weighted_sampler import MutableWeightedDict
+from .weighted_view import WeightedDictView, unpack_weighted_dict
+
+
+def _pool_items(items: Mapping, pool: Dict[str, str]) -> Dict[str, Any]:
+    """Copy an items mapping, replacing equal string values with one shared instance.
+
+    The pool is a plain deduplication table owned by the caller, so pooled strings
+    are freed together with the dictionaries that use them. Keys are unique within
+    a dictionary and are left as they are.
+    """
+    return {k: pool.setdefault(v, v) if type(v) is str else v for k, v in items.items()}
+
+
+def _split_keys(key_string: str) -> list:
+    """Split a comma or semicolon separated string, honouring double-quoted entries."""
+    if not key_string or not isinstance(key_string, str):
+        return []
+        
+    # Split by both comma and semicolon
+    keys = []
+    current_key = []
+    in_quotes = False
+    
+    for char in key_string:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char in ',;' and not in_quotes:
+            if current_key:
+                keys.append(''.join(current_key).strip())
+                current_key = []
+        else:
+            current_key.append(char)
+            
+    if current_key:
+        keys.append(''.join(current_key).strip())
+        
+    # Filter out empty strings and strip whitespace
+    return [k.strip('"') for k in keys if k.strip()]
+
+
 class WeightedDictInput:
     @classmethod
     def INPUT_TYPES(cls):
@@ -72,7 +114,7 @@ class WeightedDictSelect:
         """Select and format a value from the weighted dictionary.
         
         Args:
-            weighted_dict: Dictionary containing 'items' and 'weights' subdictionaries
+            weighted_dict: Weighted dictionary in either layout
             key: Key to select from the dictionary
             output_format: Desired output format ('simple' or 'weighted_text')
             
@@ -83,8 +125,7 @@ class WeightedDictSelect:
             ValueError: If key is not found in the dictionary
         """
         # Extract items and weights from the dictionary
-        items = weighted_dict.get("items", {})
-        weights = weighted_dict.get("weights", {})
+        items, weights = unpack_weighted_dict(weighted_dict)
         
         # Validate key exists
         if key not in items:
@@ -111,19 +152,14 @@ class WeightedDict:
     FUNCTION = "reformat_dict"
     CATEGORY = "llm-utils"
 
-    def reformat_dict(self, weighted_dict: Dict[str, Any]) -> tuple[Dict[str, Any]]:
-        items = weighted_dict["items"]
-        weights = weighted_dict["weights"]
-        
-        # Create new format: Key: {value: v, weight: w}
-        reformatted_dict = {}
-        for key in items.keys():
-            reformatted_dict[key] = {
-                "value": items[key],
-                "weight": weights[key]
-            }
-        
-        return (reformatted_dict,)
+    def reformat_dict(self, weighted_dict: Dict[str, Any]) -> tuple[Mapping]:
+        """Present the dictionary as Key: {value: v, weight: w} without copying it.
+
+        Returns:
+            tuple[Mapping]: Single-element tuple containing a read-only WeightedDictView
+        """
+        items, weights = unpack_weighted_dict(weighted_dict)
+        return (WeightedDictView(items, weights),)
 
 class WeightedDictToPrompt:
     @classmethod
@@ -146,31 +182,18 @@ class WeightedDictToPrompt:
         # Start with the template
         rendered = template
         
-        # Check dictionary format and handle accordingly
-        if "items" in weighted_dict:
-            # Handle raw format
-            items = weighted_dict["items"]
-            for key, value in items.items():
-                # Try both with and without spaces
-                placeholders = [
-                    f"{{{{ {key} }}}}",  # with spaces
-                    f"{{{{{key}}}}}"      # without spaces
-                ]
-                for placeholder in placeholders:
-                    if placeholder in rendered:
-                        rendered = rendered.replace(placeholder, str(value))
-        else:
-            # Handle reformatted format
-            for key, data in weighted_dict.items():
-                placeholders = [
-                    f"{{{{ {key} }}}}",  # with spaces
-                    f"{{{{{key}}}}}"      # without spaces
-                ]
-                value = data["value"] if isinstance(data, dict) and "value" in data else str(data)
-                for placeholder in placeholders:
-                    if placeholder in rendered:
-                        rendered = rendered.replace(placeholder, str(value))
-            
+        # Both layouts are read through the same items mapping
+        items, _ = unpack_weighted_dict(weighted_dict)
+        for key, value in items.items():
+            # Try both with and without spaces
+            placeholders = [
+                f"{{{{ {key} }}}}",  # with spaces
+                f"{{{{{key}}}}}"      # without spaces
+            ]
+            for placeholder in placeholders:
+                if placeholder in rendered:
+                    rendered = rendered.replace(placeholder, str(value))
+
         return (rendered,)
 
 class WeightedDictSelectGroup:
@@ -211,29 +234,7 @@ class WeightedDictSelectGroup:
         Returns:
             list: List of parsed keys
         """
-        if not key_string or not isinstance(key_string, str):
-            return []
-            
-        # Split by both comma and semicolon
-        keys = []
-        current_key = []
-        in_quotes = False
-        
-        for char in key_string:
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char in ',;' and not in_quotes:
-                if current_key:
-                    keys.append(''.join(current_key).strip())
-                    current_key = []
-            else:
-                current_key.append(char)
-                
-        if current_key:
-            keys.append(''.join(current_key).strip())
-            
-        # Filter out empty strings and strip whitespace
-        return [k.strip('"') for k in keys if k.strip()]
+        return _split_keys(key_string)
 
     def select_group(self, weighted_dict, allow_duplicates=False, output_format="simple", selected_keys=""):
         """Select a group of items from the weighted dictionary."""
@@ -241,8 +242,7 @@ class WeightedDictSelectGroup:
             raise ValueError("Selected keys must be provided")
             
         # Extract the correct dictionary structure
-        items = weighted_dict.get("items", {})
-        weights = weighted_dict.get("weights", {})
+        items, weights = unpack_weighted_dict(weighted_dict)
         
         # Add validation for empty dictionary
         if not items:
@@ -260,28 +260,27 @@ class WeightedDictSelectGroup:
             seen = set()
             parsed_keys = [k for k in parsed_keys if not (k in seen or seen.add(k))]
 
-        # Create selected dictionary maintaining order
-        selected_dict = {}
+        # Collect selected entries maintaining order
+        selected_items = {}
+        selected_weights = {}
         for i, key in enumerate(parsed_keys):
             # For duplicates, create unique keys by appending an index
-            if allow_duplicates and key in selected_dict:
+            if allow_duplicates and key in selected_items:
                 new_key = f"{key}_{i}"
             else:
                 new_key = key
-                
-            selected_dict[new_key] = {
-                "value": items[key],
-                "weight": weights[key]
-            }
-        
+
+            selected_items[new_key] = items[key]
+            selected_weights[new_key] = weights[key]
+        selected_dict = WeightedDictView(selected_items, selected_weights)
+
         # Format output
         formatted_output = []
-        for key in selected_dict:
-            item_data = selected_dict[key]
+        for key, value in selected_items.items():
             if output_format == "simple":
-                formatted_output.append(item_data['value'])
+                formatted_output.append(value)
             else:  # weighted_text
-                formatted_output.append(f"({item_data['value']}:{item_data['weight']})")
+                formatted_output.append(f"({value}:{selected_weights[key]})")
         
         return "\n".join(formatted_output), selected_dict
 
@@ -305,15 +304,19 @@ class WeightedDictConcat:
     CATEGORY = "llm-utils"
 
     def concat_dicts(self, dict1, dict2=None, dict3=None, dict4=None, dict5=None) -> tuple[Dict[str, Any]]:
-        # Start with the first dictionary
-        combined_items = dict1["items"].copy()
-        combined_weights = dict1["weights"].copy()
+        # Start with the first dictionary; values are pooled so entries only
+        # carry references to shared strings rather than private copies
+        pool = {}
+        items, weights = unpack_weighted_dict(dict1)
+        combined_items = _pool_items(items, pool)
+        combined_weights = dict(weights)
         
         # Add other dictionaries if they exist
         for d in [dict2, dict3, dict4, dict5]:
             if d is not None:
-                combined_items.update(d["items"])
-                combined_weights.update(d["weights"])
+                items, weights = unpack_weighted_dict(d)
+                combined_items.update(_pool_items(items, pool))
+                combined_weights.update(weights)
         
         # Create the combined weighted dictionary
         weighted_dict = {
@@ -322,3 +325,187 @@ class WeightedDictConcat:
         }
 
         return (weighted_dict,)
+
+# Mutable weighted dicts keyed by store name; module level so they persist across queue runs
+_WEIGHT_STORES: Dict[str, MutableWeightedDict] = {}
+
+
+def _sync_store(store_name: str, weighted_dict: Dict[str, Any], reset: bool = False) -> MutableWeightedDict:
+    """Return the named store, creating it from weighted_dict or syncing it with its keys.
+
+    Existing keys keep their adapted weights but take their value from the input.
+    Keys new to the store are inserted in input order unless they were removed with
+    remove_keys, so deletes survive later runs. Keys no longer in the input leave
+    the store and are added back with their input weight if they reappear.
+    """
+    items, weights = unpack_weighted_dict(weighted_dict)
+    store = _WEIGHT_STORES.get(store_name)
+    if store is None or reset:
+        store = MutableWeightedDict({"items": items, "weights": weights})
+        _WEIGHT_STORES[store_name] = store
+    else:
+        for key in [k for k in store.items if k not in items]:
+            store.delete(key, remember=False)
+        for key, value in items.items():
+            if key in store.items:
+                store.items[key] = value
+            elif key not in store.removed_keys:
+                store.insert(key, value, weights[key])
+    return store
+
+
+def _parse_weight_deltas(delta_string: str) -> list:
+    """Parse "key:delta" entries separated by commas or semicolons.
+
+    Raises:
+        ValueError: If an entry has no delta or the delta is not a number
+    """
+    deltas = []
+    for entry in _split_keys(delta_string):
+        key, sep, delta = entry.rpartition(":")
+        key = key.strip().strip('"')
+        try:
+            if not sep or not key:
+                raise ValueError
+            deltas.append((key, float(delta)))
+        except ValueError:
+            raise ValueError(f"Invalid weight delta '{entry}'. Expected format is key:delta, e.g. key1:-0.5")
+    return deltas
+
+
+class WeightedDictUpdateWeights:
+    @classmethod
+    def INPUT_TYPES(cls):
+        """Define the input parameters for the node.
+
+        Returns:
+            dict: Configuration for input parameters:
+                - weighted_dict: Dictionary used to create the store and add new keys
+                - store_name: Name of the persistent store to update
+                - weight_deltas: Comma separated key:delta pairs added to current weights
+                - remove_keys: Comma separated keys to delete from the store
+                - reset: Discard adapted weights and rebuild the store from weighted_dict
+        """
+        return {
+            "required": {
+                "weighted_dict": ("DICT",),
+                "store_name": ("STRING", {"default": "default"}),
+                "weight_deltas": ("STRING", {
+                    "multiline": False,
+                    "default": "",
+                    "placeholder": "key1:-0.5,key2:+1.0"
+                }),
+            },
+            "optional": {
+                "remove_keys": ("STRING", {
+                    "multiline": False,
+                    "default": "",
+                    "placeholder": "key1,key2"
+                }),
+                "reset": ("BOOLEAN", {"default": False}),
+            }
+        }
+
+    RETURN_TYPES = ("DICT",)
+    FUNCTION = "update_weights"
+    CATEGORY = "llm-utils"
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        # Deltas accumulate in the store, so run again on every queue
+        return float("NaN")
+
+    def update_weights(self, weighted_dict, store_name="default", weight_deltas="", remove_keys="", reset=False) -> tuple[Dict[str, Any]]:
+        """Apply weight deltas to a persistent weighted dictionary.
+
+        Args:
+            weighted_dict: Weighted dictionary in either layout, used to create the store and add new keys
+            store_name: Name of the store; weights persist under it across queue runs
+            weight_deltas: Comma separated key:delta pairs; resulting weights are clamped at 0
+            remove_keys: Comma separated keys to delete
+            reset: Rebuild the store from weighted_dict before applying changes
+
+        Returns:
+            tuple[Dict[str, Any]]: Single-element tuple containing the updated dictionary
+
+        Raises:
+            ValueError: If a delta is malformed or refers to a key not in the store
+        """
+        store = _sync_store(store_name, weighted_dict, reset)
+        deltas = _parse_weight_deltas(weight_deltas)
+        removals = _split_keys(remove_keys)
+
+        invalid_keys = [k for k, _ in deltas if k not in store] + [k for k in removals if k not in store]
+        if invalid_keys:
+            raise ValueError(f"Invalid key(s) found in update: {', '.join(invalid_keys)}")
+
+        for key, delta in deltas:
+            store.update_weight(key, delta)
+        for key in dict.fromkeys(removals):
+            store.delete(key)
+
+        return (store.as_dict(),)
+
+
+class WeightedDictSample:
+    @classmethod
+    def INPUT_TYPES(cls):
+        """Define the input parameters for the node.
+
+        Returns:
+            dict: Configuration for input parameters:
+                - weighted_dict: Dictionary to sample from
+                - seed: Random seed for the draw
+                - store_name: Optional existing store to sample from instead of building a table
+        """
+        return {
+            "required": {
+                "weighted_dict": ("DICT",),
+                "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
+            },
+            "optional": {
+                "store_name": ("STRING", {"default": ""}),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "STRING")
+    RETURN_NAMES = ("value", "key")
+    FUNCTION = "sample"
+    CATEGORY = "llm-utils"
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        # A named store changes outside this node's inputs, so draw again on every queue
+        if kwargs.get("store_name"):
+            return float("NaN")
+        return ""
+
+    def sample(self, weighted_dict, seed=0, store_name="") -> tuple[str, str]:
+        """Draw one entry with probability proportional to its weight.
+
+        When store_name names a store created by WeightedDictUpdateWeights, the draw
+        uses its tree directly in O(log n) and weighted_dict is only used to order
+        execution; otherwise a tree is built from the input.
+
+        Args:
+            weighted_dict: Weighted dictionary in either layout; connect the output of
+                WeightedDictUpdateWeights so updates run before the draw
+            seed: Random seed
+            store_name: Name of an existing store, or empty to sample the input as-is
+
+        Returns:
+            tuple[str, str]: The sampled value and its key
+
+        Raises:
+            ValueError: If store_name does not name an existing store
+        """
+        if store_name:
+            store = _WEIGHT_STORES.get(store_name)
+            if store is None:
+                raise ValueError(f"Weight store '{store_name}' does not exist. Create it with WeightedDictUpdateWeights first")
+        else:
+            items, weights = unpack_weighted_dict(weighted_dict)
+            store = MutableWeightedDict({"items": items, "weights": weights})
+
+        key = store.sample(random.Random(seed))
+        return str(store.items[key]), key
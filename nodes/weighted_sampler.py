@@ -0,0 +1,173 @@
+import random
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class FenwickTree:
+    """Binary indexed tree over a list of weights.
+
+    Supports O(log n) point updates, prefix sums, appends and sampling by
+    prefix-sum descent. Indices are 0-based; the internal array is 1-based.
+    """
+
+    def __init__(self, weights: Iterable[float] = ()):
+        self._tree = [0.0]
+        self._tree.extend(float(w) for w in weights)
+        size = len(self._tree)
+        # Linear-time build: push each node's sum into its parent
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self._tree[parent] += self._tree[i]
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def add(self, index: int, delta: float) -> None:
+        """Add delta to the weight at index."""
+        i = index + 1
+        size = len(self._tree)
+        while i < size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, end: int) -> float:
+        """Return the sum of weights in [0, end)."""
+        total = 0.0
+        i = end
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def total(self) -> float:
+        return self.prefix_sum(len(self))
+
+    def append(self, weight: float) -> None:
+        """Append a weight at the end of the tree."""
+        i = len(self._tree)
+        # Node i covers the range (i - lowbit(i), i]
+        covered = self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i))
+        self._tree.append(float(weight) + covered)
+
+    def find(self, target: float) -> int:
+        """Return the smallest index whose inclusive prefix sum exceeds target.
+
+        Args:
+            target: Value in [0, total())
+
+        Returns:
+            int: 0-based index, clamped to the last element
+        """
+        size = len(self)
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= size and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(position, size - 1)
+
+
+class MutableWeightedDict:
+    """Weighted dictionary whose weights can change between draws.
+
+    Keeps the usual ``{"items": ..., "weights": ...}`` mappings alongside a
+    Fenwick tree indexed by slot, so weight updates, inserts, deletes and
+    weighted sampling are all O(log n) instead of rebuilding a sampling table.
+    Slots freed by deletes are reused by later inserts, and deleted keys are
+    remembered in ``removed_keys`` until they are inserted again.
+    """
+
+    def __init__(self, weighted_dict: Optional[Dict[str, Any]] = None):
+        self.items: Dict[str, Any] = {}
+        self.weights: Dict[str, float] = {}
+        self.removed_keys: Set[str] = set()
+        self._slot_keys: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+
+        if weighted_dict is not None:
+            self.items.update(weighted_dict["items"])
+            self.weights.update((k, max(0.0, float(w))) for k, w in weighted_dict["weights"].items())
+            self._slot_keys = list(self.items)
+            self._slots = {key: slot for slot, key in enumerate(self._slot_keys)}
+        self._tree = FenwickTree(self.weights[key] for key in self._slot_keys)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.items
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a snapshot in the ``{"items", "weights"}`` layout used by the other nodes.
+
+        The mappings are copies, so later updates do not change earlier outputs.
+        """
+        return {"items": dict(self.items), "weights": dict(self.weights)}
+
+    def set_weight(self, key: str, weight: float) -> None:
+        weight = max(0.0, float(weight))
+        self._tree.add(self._slots[key], weight - self.weights[key])
+        self.weights[key] = weight
+
+    def update_weight(self, key: str, delta: float) -> None:
+        """Add delta to the weight of key, clamping the result at zero."""
+        self.set_weight(key, self.weights[key] + delta)
+
+    def insert(self, key: str, value: Any, weight: float) -> None:
+        """Insert a new key, or replace the value and weight of an existing one."""
+        self.removed_keys.discard(key)
+        if key in self._slots:
+            self.items[key] = value
+            self.set_weight(key, weight)
+            return
+
+        weight = max(0.0, float(weight))
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_keys[slot] = key
+            self._tree.add(slot, weight)
+        else:
+            slot = len(self._slot_keys)
+            self._slot_keys.append(key)
+            self._tree.append(weight)
+        self._slots[key] = slot
+        self.items[key] = value
+        self.weights[key] = weight
+
+    def delete(self, key: str, remember: bool = True) -> None:
+        """Delete key, recording it in removed_keys unless remember is False."""
+        slot = self._slots.pop(key)
+        self._tree.add(slot, -self.weights.pop(key))
+        del self.items[key]
+        self._slot_keys[slot] = None
+        self._free_slots.append(slot)
+        if remember:
+            self.removed_keys.add(key)
+
+    def sample(self, rng: Optional[random.Random] = None) -> str:
+        """Draw a key with probability proportional to its weight.
+
+        Raises:
+            ValueError: If there are no entries or every weight is zero
+        """
+        rng = rng or random
+        total = self._tree.total()
+        if not self.items or total <= 0.0:
+            raise ValueError("Cannot sample from a weighted dictionary with no positive weights")
+
+        key = self._slot_keys[self._tree.find(rng.random() * total)]
+        if key is None or self.weights[key] <= 0.0:
+            # Accumulated float error left a residual total or pointed at an empty
+            # slot; rebuild from the exact weights once and retry
+            self._tree = FenwickTree(self.weights[k] if k is not None else 0.0 for k in self._slot_keys)
+            total = self._tree.total()
+            if total <= 0.0:
+                raise ValueError("Cannot sample from a weighted dictionary with no positive weights")
+            key = self._slot_keys[self._tree.find(rng.random() * total)]
+            if key is None or self.weights[key] <= 0.0:
+                raise ValueError("Sampling landed on an empty slot after rebuilding the weight tree")
+        return key
@@ -0,0 +1,72 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+
+class WeightedDictView(Mapping):
+    """Read-only ``{key: {"value": v, "weight": w}}`` view over an items/weights pair.
+
+    Nothing is allocated per entry up front; the inner ``{"value", "weight"}``
+    dict is only built for the entry being read. The underlying mappings are
+    shared, not copied.
+    """
+
+    __slots__ = ("_items", "_weights")
+
+    def __init__(self, items: Mapping, weights: Mapping):
+        self._items = items
+        self._weights = weights
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return {"value": self._items[key], "weight": self._weights[key]}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __repr__(self) -> str:
+        return f"WeightedDictView({len(self)} entries)"
+
+
+class _FieldView(Mapping):
+    """Read-only projection of one field of a reformatted ``{key: {"value", "weight"}}`` dict."""
+
+    __slots__ = ("_entries", "_field", "_default")
+
+    def __init__(self, entries: Mapping, field: str, default: Any = None):
+        self._entries = entries
+        self._field = field
+        self._default = default
+
+    def __getitem__(self, key: str) -> Any:
+        data = self._entries[key]
+        if isinstance(data, Mapping) and self._field in data:
+            return data[self._field]
+        # Plain values in a reformatted dict stand for themselves with the default weight
+        return data if self._default is None else self._default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+
+def unpack_weighted_dict(weighted_dict: Mapping) -> Tuple[Mapping, Mapping]:
+    """Return ``(items, weights)`` mappings for any weighted dict layout without copying.
+
+    Accepts the raw ``{"items": ..., "weights": ...}`` layout, a WeightedDictView,
+    or a plain reformatted ``{key: {"value": v, "weight": w}}`` dict.
+    """
+    if isinstance(weighted_dict, WeightedDictView):
+        return weighted_dict._items, weighted_dict._weights
+    if "items" in weighted_dict and "weights" in weighted_dict:
+        return weighted_dict["items"], weighted_dict["weights"]
+    return _FieldView(weighted_dict, "value"), _FieldView(weighted_dict, "weight", 1.0)
@@ -10,12 +10,19 @@ sys.path.append(project_root)
 def create_test_suite():
     # Import test modules
     from tests.test_weighted_dict import TestWeightedDict
+    from tests.test_prompt_dedupe import TestPromptDedupe
+    from tests.test_weighted_sampler import TestFenwickTree, TestMutableWeightedDict
+    from tests.test_weighted_view import TestWeightedDictView
     
     # Create suite
     suite = unittest.TestSuite()
     
     # Add test cases
     suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestWeightedDict))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestPromptDedupe))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestFenwickTree))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestMutableWeightedDict))
+    suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestWeightedDictView))
     
     return suite
 
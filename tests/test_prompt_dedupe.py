@@ -0,0 +1,87 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from nodes.prompt_dedupe import PromptDedupe, MinHashLSH, _choose_bands, _MAX_BUCKET_SIZE
+
+
+@unittest.skipIf(numpy is None, "numpy is required for prompt deduplication")
+class TestPromptDedupe(unittest.TestCase):
+    def test_exact_duplicates_keep_first(self):
+        node = PromptDedupe()
+        prompts = [
+            "a red fox jumping over a fence at dawn",
+            "a blue whale swimming in a deep ocean",
+            "a red fox jumping over a fence at dawn",
+        ]
+        kept, removed = node.dedupe_prompts(prompts)
+
+        self.assertEqual(kept, prompts[:2])
+        self.assertEqual(removed, 1)
+
+    def test_near_duplicates_removed(self):
+        node = PromptDedupe()
+        prompts = (
+            "a cinematic photo of a red fox jumping over a wooden fence at dawn in the misty forest, highly detailed\n"
+            "a cinematic photo of a red fox jumping over a wooden fence at dawn in the misty forest, highly detailed, 4k\n"
+            "an oil painting of a lighthouse on a rocky cliff during a violent storm at night\n"
+        )
+        kept, removed = node.dedupe_prompts([prompts], threshold=[0.7], split_lines=[True])
+
+        self.assertEqual(len(kept), 2)
+        self.assertEqual(removed, 1)
+        self.assertTrue(kept[0].endswith("highly detailed"))
+        self.assertTrue(kept[1].startswith("an oil painting"))
+
+    def test_split_lines_ignores_blank_lines(self):
+        node = PromptDedupe()
+        kept, removed = node.dedupe_prompts(["first prompt\n\n  \nsecond prompt"], split_lines=[True])
+
+        self.assertEqual(kept, ["first prompt", "second prompt"])
+        self.assertEqual(removed, 0)
+
+    def test_multiline_prompts_stay_whole_by_default(self):
+        node = PromptDedupe()
+        prompts = ["a cat\nthat meows", "a cat\nthat barks"]
+        kept, removed = node.dedupe_prompts(prompts)
+
+        self.assertEqual(kept, prompts)
+        self.assertEqual(removed, 0)
+
+    def test_filter_streams_across_chunks(self):
+        lsh = MinHashLSH(threshold=0.9)
+        # Every prompt appears twice; the pairs straddle the internal chunk boundary
+        prompts = [f"prompt number {i} with some shared words" for i in range(750)]
+        kept = list(lsh.filter(iter(prompts + prompts)))
+
+        self.assertEqual(kept, prompts)
+
+    def test_template_prompts_cap_bucket_scans(self):
+        lsh = MinHashLSH()
+        template = "a cinematic photo of a {} standing in a {} during {} with soft light and film grain"
+        prompts = [template.format(f"a{i}", f"b{i}", f"c{i}") for i in range(1000)]
+        kept = list(lsh.filter(prompts + prompts[:10]))
+
+        self.assertEqual(kept, prompts)
+        self.assertTrue(all(len(bucket) <= _MAX_BUCKET_SIZE for buckets in lsh._buckets for bucket in buckets.values()))
+
+    def test_signatures_match_for_identical_text(self):
+        lsh = MinHashLSH(num_perm=64)
+        signatures = lsh.signatures(["same words here", "same words here", "other text entirely"])
+
+        self.assertEqual(signatures.shape, (3, 64))
+        self.assertTrue((signatures[0] == signatures[1]).all())
+        self.assertFalse((signatures[0] == signatures[2]).all())
+
+    def test_choose_bands_divides_permutations(self):
+        for num_perm in (16, 64, 128):
+            bands, rows = _choose_bands(num_perm, 0.8)
+            self.assertEqual(bands * rows, num_perm)
+
+
+if __name__ == '__main__':
+    unittest.main()
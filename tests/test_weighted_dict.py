@@ -2,7 +2,10 @@ import unittest
 import sys
 import os
 
-from nodes.weighted_dict import WeightedDictInput, WeightedDictSelect, WeightedDictConcat, WeightedDictSelectGroup
+from nodes.weighted_dict import (
+    WeightedDictInput, WeightedDictSelect, WeightedDictConcat, WeightedDictSelectGroup,
+    WeightedDictUpdateWeights, WeightedDictSample, _WEIGHT_STORES
+)
 
 # Mock ComfyUI's dependencies if needed
 try:
@@ -56,6 +59,20 @@ class TestWeightedDict(unittest.TestCase):
         self.assertEqual(combined_dict["items"]["key3"], "value3")
         self.assertEqual(combined_dict["weights"]["key3"], 3.0)
 
+    def test_weighted_dict_values_are_pooled(self):
+        # Equal values built independently should share one string object after concat
+        node_input = WeightedDictInput()
+        value_a = "".join(["shared", "_value"])
+        value_b = "".join(["shared", "_value"])
+        self.assertIsNot(value_a, value_b)
+
+        dict1 = node_input.create_weighted_dict("key1", value_a, 1.0)[0]
+        dict2 = {"items": {"key2": value_b}, "weights": {"key2": 2.0}}
+
+        combined_dict = WeightedDictConcat().concat_dicts(dict1, dict2)[0]
+        self.assertEqual(combined_dict["items"]["key2"], "shared_value")
+        self.assertIs(combined_dict["items"]["key1"], combined_dict["items"]["key2"])
+
     def test_weighted_dict_select(self):
         # Create a test dictionary with multiple entries
         node_input = WeightedDictInput()
@@ -176,5 +193,132 @@ class TestWeightedDict(unittest.TestCase):
         
         self.assertEqual(formatted_output, "(value1:1.0)\n(value2:2.0)")
 
+    def test_weighted_dict_update_weights_persists(self):
+        _WEIGHT_STORES.clear()
+        self.addCleanup(_WEIGHT_STORES.clear)
+        node_update = WeightedDictUpdateWeights()
+        test_dict = {
+            "items": {"key1": "value1", "key2": "value2"},
+            "weights": {"key1": 1.0, "key2": 2.0}
+        }
+
+        updated = node_update.update_weights(test_dict, "test", "key1:+0.5, key2:-3")[0]
+        self.assertEqual(updated["weights"], {"key1": 1.5, "key2": 0.0})
+
+        # A later queue run keeps the adapted weights and adds new keys
+        test_dict["items"] = dict(test_dict["items"], key3="value3")
+        test_dict["weights"] = dict(test_dict["weights"], key3=1.0)
+        updated = node_update.update_weights(test_dict, "test", "key1:+0.5", remove_keys="key2")[0]
+        self.assertEqual(updated["items"], {"key1": "value1", "key3": "value3"})
+        self.assertEqual(updated["weights"], {"key1": 2.0, "key3": 1.0})
+        self.assertEqual(test_dict["weights"]["key1"], 1.0)
+
+        updated = node_update.update_weights(test_dict, "test", "", reset=True)[0]
+        self.assertEqual(updated["weights"], test_dict["weights"])
+
+        with self.assertRaises(ValueError) as context:
+            node_update.update_weights(test_dict, "test", "missing:1")
+        self.assertTrue("Invalid key(s)" in str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            node_update.update_weights(test_dict, "test", "key1")
+        self.assertTrue("Expected format is key:delta" in str(context.exception))
+
+    def test_weighted_dict_sample(self):
+        _WEIGHT_STORES.clear()
+        self.addCleanup(_WEIGHT_STORES.clear)
+        node_sample = WeightedDictSample()
+        test_dict = {
+            "items": {"key1": "value1", "key2": "value2"},
+            "weights": {"key1": 0.0, "key2": 2.0}
+        }
+
+        value, key = node_sample.sample(test_dict, seed=42)
+        self.assertEqual((value, key), ("value2", "key2"))
+        self.assertEqual(node_sample.sample(test_dict, seed=7), node_sample.sample(test_dict, seed=7))
+
+        # Sampling from a named store sees its adapted weights
+        updated = WeightedDictUpdateWeights().update_weights(test_dict, "test", "key1:+5, key2:-2")[0]
+        value, key = node_sample.sample(updated, seed=42, store_name="test")
+        self.assertEqual((value, key), ("value1", "key1"))
+
+        # Weights decremented to zero raise instead of returning an empty slot
+        WeightedDictUpdateWeights().update_weights(test_dict, "test", "key1:-5", remove_keys="key2")
+        with self.assertRaises(ValueError):
+            node_sample.sample(test_dict, seed=42, store_name="test")
+
+    def test_weighted_dict_update_weights_delete_survives_rerun(self):
+        _WEIGHT_STORES.clear()
+        self.addCleanup(_WEIGHT_STORES.clear)
+        node_update = WeightedDictUpdateWeights()
+
+        def fresh_dict():
+            return {
+                "items": {"a": "value_a", "b": "value_b"},
+                "weights": {"a": 1.0, "b": 2.0}
+            }
+
+        first = node_update.update_weights(fresh_dict(), "test", "", remove_keys="b")[0]
+        second = node_update.update_weights(fresh_dict(), "test", "a:+1")[0]
+        self.assertEqual(second["items"], {"a": "value_a"})
+        self.assertEqual(second["weights"], {"a": 2.0})
+
+        # The reformatted layout yields new mappings on every run as well
+        reformatted = {"a": {"value": "value_a", "weight": 1.0}, "b": {"value": "value_b", "weight": 2.0}}
+        third = node_update.update_weights(reformatted, "test", "")[0]
+        self.assertEqual(third["items"], {"a": "value_a"})
+
+        # Earlier outputs are snapshots and are not changed by later runs
+        self.assertEqual(first["weights"], {"a": 1.0})
+
+        # New upstream keys are still added, and reset brings removed keys back
+        grown = fresh_dict()
+        grown["items"]["c"] = "value_c"
+        grown["weights"]["c"] = 3.0
+        fourth = node_update.update_weights(grown, "test", "")[0]
+        self.assertEqual(fourth["weights"], {"a": 2.0, "c": 3.0})
+        fifth = node_update.update_weights(fresh_dict(), "test", "", reset=True)[0]
+        self.assertEqual(fifth["weights"], {"a": 1.0, "b": 2.0})
+
+    def test_weighted_dict_update_weights_follows_upstream(self):
+        _WEIGHT_STORES.clear()
+        self.addCleanup(_WEIGHT_STORES.clear)
+        node_update = WeightedDictUpdateWeights()
+        node_update.update_weights({"items": {"a": "old"}, "weights": {"a": 1.0}}, "test", "a:+1")
+
+        # Values follow the input while adapted weights are kept
+        updated = node_update.update_weights({"items": {"a": "new"}, "weights": {"a": 1.0}}, "test", "")[0]
+        self.assertEqual(updated["items"], {"a": "new"})
+        self.assertEqual(updated["weights"], {"a": 2.0})
+
+        # New keys are inserted in input order
+        new_keys = [f"k{i}" for i in range(20, 0, -1)]
+        grown = {
+            "items": dict({"a": "new"}, **{k: k for k in new_keys}),
+            "weights": dict({"a": 1.0}, **{k: 1.0 for k in new_keys})
+        }
+        updated = node_update.update_weights(grown, "test", "")[0]
+        self.assertEqual(list(updated["items"]), ["a"] + new_keys)
+
+        # Keys dropped upstream leave the store and return with their input weight
+        updated = node_update.update_weights({"items": {"k1": "k1"}, "weights": {"k1": 1.0}}, "test", "")[0]
+        self.assertEqual(updated["items"], {"k1": "k1"})
+        updated = node_update.update_weights({"items": {"a": "new"}, "weights": {"a": 3.0}}, "test", "")[0]
+        self.assertEqual(updated["weights"], {"a": 3.0})
+
+    def test_weighted_dict_sample_requires_existing_store(self):
+        _WEIGHT_STORES.clear()
+        self.addCleanup(_WEIGHT_STORES.clear)
+        test_dict = {"items": {"key1": "value1"}, "weights": {"key1": 1.0}}
+
+        with self.assertRaises(ValueError) as context:
+            WeightedDictSample().sample(test_dict, seed=0, store_name="misspelled")
+        self.assertTrue("does not exist" in str(context.exception))
+        self.assertNotIn("misspelled", _WEIGHT_STORES)
+
+        self.assertNotEqual(WeightedDictSample.IS_CHANGED(weighted_dict=test_dict, seed=0, store_name="test"),
+                            WeightedDictSample.IS_CHANGED(weighted_dict=test_dict, seed=0, store_name="test"))
+        self.assertEqual(WeightedDictSample.IS_CHANGED(weighted_dict=test_dict, seed=0, store_name=""), "")
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
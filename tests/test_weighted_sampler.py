@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from nodes.weighted_sampler import FenwickTree, MutableWeightedDict
+
+
+class TestFenwickTree(unittest.TestCase):
+    def test_prefix_sums(self):
+        weights = [1.0, 2.0, 3.0, 4.0, 5.0]
+        tree = FenwickTree(weights)
+
+        self.assertEqual(len(tree), 5)
+        for end in range(6):
+            self.assertEqual(tree.prefix_sum(end), sum(weights[:end]))
+        self.assertEqual(tree.total(), 15.0)
+
+    def test_add_and_append(self):
+        weights = [1.0, 2.0, 3.0]
+        tree = FenwickTree(weights)
+        tree.add(1, 5.0)
+        weights[1] += 5.0
+        for w in [4.0, 0.5, 2.5, 1.0, 7.0]:
+            tree.append(w)
+            weights.append(w)
+
+        for end in range(len(weights) + 1):
+            self.assertAlmostEqual(tree.prefix_sum(end), sum(weights[:end]))
+
+    def test_find_descends_to_owning_index(self):
+        tree = FenwickTree([1.0, 0.0, 2.0, 3.0])
+
+        self.assertEqual(tree.find(0.0), 0)
+        self.assertEqual(tree.find(0.99), 0)
+        self.assertEqual(tree.find(1.0), 2)  # zero weight index 1 is skipped
+        self.assertEqual(tree.find(2.99), 2)
+        self.assertEqual(tree.find(3.0), 3)
+        self.assertEqual(tree.find(5.99), 3)
+
+
+class TestMutableWeightedDict(unittest.TestCase):
+    def setUp(self):
+        self.weighted_dict = {
+            "items": {"key1": "value1", "key2": "value2", "key3": "value3"},
+            "weights": {"key1": 1.0, "key2": 0.0, "key3": 3.0},
+        }
+
+    def test_as_dict_layout(self):
+        store = MutableWeightedDict(self.weighted_dict)
+
+        self.assertEqual(store.as_dict(), self.weighted_dict)
+        self.assertIsNot(store.items, self.weighted_dict["items"])
+
+    def test_sample_follows_weights(self):
+        store = MutableWeightedDict(self.weighted_dict)
+        rng = random.Random(0)
+        counts = {"key1": 0, "key2": 0, "key3": 0}
+        for _ in range(4000):
+            counts[store.sample(rng)] += 1
+
+        self.assertEqual(counts["key2"], 0)
+        self.assertAlmostEqual(counts["key3"] / counts["key1"], 3.0, delta=0.4)
+
+    def test_update_weight_clamps_at_zero(self):
+        store = MutableWeightedDict(self.weighted_dict)
+        store.update_weight("key1", -5.0)
+        store.update_weight("key2", 2.0)
+
+        self.assertEqual(store.weights["key1"], 0.0)
+        self.assertEqual(store.weights["key2"], 2.0)
+        rng = random.Random(1)
+        self.assertNotIn("key1", {store.sample(rng) for _ in range(200)})
+
+    def test_insert_and_delete_reuse_slots(self):
+        store = MutableWeightedDict(self.weighted_dict)
+        store.delete("key3")
+        store.insert("key4", "value4", 2.0)
+
+        self.assertEqual(len(store), 3)
+        self.assertNotIn("key3", store)
+        self.assertEqual(store.items["key4"], "value4")
+        rng = random.Random(2)
+        self.assertEqual({store.sample(rng) for _ in range(200)}, {"key1", "key4"})
+
+    def test_sample_after_weights_decremented_to_zero_raises(self):
+        store = MutableWeightedDict({"items": {"a": "x", "b": "y", "c": "z"}, "weights": {"a": 0.1, "b": 0.2, "c": 0.3}})
+        store.delete("c")
+        store.update_weight("a", -0.1)
+        store.update_weight("b", -0.2)
+
+        with self.assertRaises(ValueError):
+            store.sample(random.Random(0))
+
+    def test_as_dict_returns_snapshot(self):
+        store = MutableWeightedDict(self.weighted_dict)
+        snapshot = store.as_dict()
+        store.update_weight("key1", 1.0)
+        store.delete("key2")
+
+        self.assertEqual(snapshot, self.weighted_dict)
+
+    def test_delete_is_remembered_until_reinserted(self):
+        store = MutableWeightedDict(self.weighted_dict)
+        store.delete("key2")
+        self.assertEqual(store.removed_keys, {"key2"})
+
+        store.insert("key2", "value2", 1.0)
+        self.assertEqual(store.removed_keys, set())
+
+    def test_sample_without_weight_raises(self):
+        store = MutableWeightedDict({"items": {"key1": "value1"}, "weights": {"key1": 0.0}})
+
+        with self.assertRaises(ValueError):
+            store.sample()
+
+
+if __name__ == '__main__':
+    unittest.main()
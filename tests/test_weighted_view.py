@@ -0,0 +1,83 @@
+import unittest
+
+from nodes.weighted_view import WeightedDictView, unpack_weighted_dict
+from nodes.weighted_dict import (
+    WeightedDict, WeightedDictSelect, WeightedDictSelectGroup, WeightedDictToPrompt, WeightedDictConcat
+)
+
+
+class TestWeightedDictView(unittest.TestCase):
+    def setUp(self):
+        self.raw_dict = {
+            "items": {"animal": "cat", "sound": "meow"},
+            "weights": {"animal": 1.0, "sound": 2.0}
+        }
+        self.reformatted = {
+            "animal": {"value": "cat", "weight": 1.0},
+            "sound": {"value": "meow", "weight": 2.0}
+        }
+
+    def test_view_presents_reformatted_layout(self):
+        view = WeightedDictView(self.raw_dict["items"], self.raw_dict["weights"])
+
+        self.assertEqual(len(view), 2)
+        self.assertIn("animal", view)
+        self.assertEqual(list(view), ["animal", "sound"])
+        self.assertEqual(view["sound"], {"value": "meow", "weight": 2.0})
+        self.assertEqual(view, self.reformatted)
+        with self.assertRaises(KeyError):
+            view["missing"]
+
+    def test_view_is_read_only_and_shares_storage(self):
+        view = WeightedDictView(self.raw_dict["items"], self.raw_dict["weights"])
+
+        with self.assertRaises(TypeError):
+            view["animal"] = {"value": "dog", "weight": 1.0}
+        self.raw_dict["weights"]["animal"] = 5.0
+        self.assertEqual(view["animal"]["weight"], 5.0)
+
+    def test_unpack_accepts_every_layout(self):
+        view = WeightedDictView(self.raw_dict["items"], self.raw_dict["weights"])
+
+        items, weights = unpack_weighted_dict(self.raw_dict)
+        self.assertIs(items, self.raw_dict["items"])
+        items, weights = unpack_weighted_dict(view)
+        self.assertIs(weights, self.raw_dict["weights"])
+
+        items, weights = unpack_weighted_dict(self.reformatted)
+        self.assertEqual(dict(items), self.raw_dict["items"])
+        self.assertEqual(dict(weights), self.raw_dict["weights"])
+
+        items, weights = unpack_weighted_dict({"animal": "dog"})
+        self.assertEqual(items["animal"], "dog")
+        self.assertEqual(weights["animal"], 1.0)
+
+    def test_reformat_dict_returns_view(self):
+        reformatted = WeightedDict().reformat_dict(self.raw_dict)[0]
+
+        self.assertIsInstance(reformatted, WeightedDictView)
+        self.assertEqual(reformatted, self.reformatted)
+
+    def test_nodes_accept_both_layouts(self):
+        view = WeightedDict().reformat_dict(self.raw_dict)[0]
+        template = "A {{ animal }} that says {{sound}}"
+
+        for weighted_dict in (self.raw_dict, view, self.reformatted):
+            self.assertEqual(
+                WeightedDictToPrompt().render_prompt(template, weighted_dict)[0],
+                "A cat that says meow"
+            )
+            self.assertEqual(
+                WeightedDictSelect().select_from_dict(weighted_dict, "sound", "weighted_text")[0],
+                "(meow:2.0)"
+            )
+            formatted_output, selected_dict = WeightedDictSelectGroup().select_group(
+                weighted_dict, allow_duplicates=True, selected_keys="sound,animal,sound"
+            )
+            self.assertEqual(formatted_output, "meow\ncat\nmeow")
+            self.assertEqual(selected_dict["sound_2"], {"value": "meow", "weight": 2.0})
+            self.assertEqual(WeightedDictConcat().concat_dicts(weighted_dict)[0], self.raw_dict)
+
+
+if __name__ == '__main__':
+    unittest.main()